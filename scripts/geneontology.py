@@ -1,12 +1,66 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import csv
+import mmap
 import re
+from collections import defaultdict, deque
 from graphmaster import Graph
 import sys
 import os
 import urllib.request
 
+# regexps to parse OBO term lines, compiled once at import time so that
+# load_OBO does not pay re.compile (nor the module-level regex cache lookup)
+# on every call
+_RE_GO_VALUE = re.compile(rb'^(GO:\d+)\b')
+_RE_GO_DEF_VALUE = re.compile(r'^"(.+)"\s+\[.*\]\s*$')
+
+# node-type tags, interned so every node shares the same string object
+_GOTERM_TYPE = sys.intern('GOTerm')
+_GENE_PRODUCT_TYPE = sys.intern('GeneProduct')
+
+# interned caches for field values that repeat massively: the three GO
+# namespaces and the ~20 distinct GAF evidence codes
+_NAMESPACES = {}
+_EVIDENCE_CODES = {}
+
+# compact node-type codes used by the traversal hot paths: one byte per
+# node in a dense array instead of a per-node attribute-dict lookup
+_GOTERM = 1
+_GENE_PRODUCT = 2
+_TYPE_CODES = { _GOTERM_TYPE: _GOTERM, _GENE_PRODUCT_TYPE: _GENE_PRODUCT }
+
+def _type_index(go:Graph):
+	"""
+	Returns (node -> dense index dict, bytearray of type codes) for the
+	graph, built once per graph state. The nodes dict stays the source of
+	truth; this is a struct-of-arrays view cached alongside the other
+	memoized results, so it is rebuilt automatically after any mutation.
+	"""
+	cached = go._closure_cache.get('_type_index')
+	if cached is None:
+		index = {}
+		codes = bytearray(len(go.nodes))
+		for i, (node, attributes) in enumerate(go.nodes.items()):
+			index[node] = i
+			codes[i] = _TYPE_CODES.get(attributes.get('type'), 0)
+		cached = (index, codes)
+		go._closure_cache['_type_index'] = cached
+	return cached
+
+def _parse_go_id(value):
+	"""
+	Extract a GO identifier at the start of an OBO field value (bytes).
+	Most identifiers are 'GO:' followed by 7 digits, so take that fast path
+	and only fall back to the regex for unusual widths.
+	"""
+	head = value[:10]
+	if head.startswith(b'GO:') and head[3:].isdigit():
+		return head.decode('ascii')
+	m = _RE_GO_VALUE.match(value)
+	return m.group(1).decode('ascii') if m else None
+
 def load_OBO(filename=sys.path[0]+'/data/go-basic.obo'):
 	"""
 	parse the OBO file and returns the graph
@@ -26,66 +80,126 @@ def load_OBO(filename=sys.path[0]+'/data/go-basic.obo'):
 	relationship: part_of GO:0042255 ! ribosome assembly
 	relationship: part_of GO:0042274 ! ribosomal small subunit biogenesis
 	"""
-	def parseTerm(lines):
-		# search for obsolete
-		for l in lines:
-			if l.startswith('is_obsolete: true'):
-				return
-		# otherwise create node
-		go_id = re_go_id.match(lines.pop(0)).group(1)
-		go_attr = go_graph.add_node(go_id) # add node to graph and get the node attribute dict
-		go_attr['type'] = 'GOTerm'
-		for line in lines:
-			if re_go_name.match(line): go_attr['name'] = re_go_name.match(line).group(1)
-			elif re_go_namespace.match(line): go_attr['namespace'] = re_go_namespace.match(line).group(1)
-			elif re_go_def.match(line): go_attr['def'] = re_go_def.match(line).group(1)
-			elif re_go_alt_id.match(line): go_graph.alt_id[ re_go_alt_id.match(line).group(1) ] = go_id  # alt_id → go_id
-			elif re_go_is_a.match(line): 
-				parent_id = re_go_is_a.match(line).group(1)
-				go_graph.add_edge(go_id, parent_id, { 'relationship': 'is a' })
-			elif re_go_part_of.match(line): 
-				parent_id = re_go_part_of.match(line).group(1)
-				go_graph.add_edge(go_id, parent_id, { 'relationship': 'part of' })
 	# method main
 	go_graph = Graph(directed=True, weighted=False)
 	go_graph.alt_id = {} # alternate GO ids
-	# regexp to parse term lines
-	re_go_id = re.compile(r'^id:\s+(GO:\d+)\s*$')
-	re_go_name = re.compile(r'^name:\s+(.+)\s*$')
-	re_go_namespace = re.compile(r'^namespace:\s+(.+)\s*$')
-	re_go_def = re.compile(r'^def:\s+"(.+)"\s+\[.*\]\s*$')
-	re_go_alt_id = re.compile(r'^alt_id:\s+(GO:\d+)\s*$')
-	re_go_is_a = re.compile(r'^is_a:\s+(GO:\d+)\s')
-	re_go_xref = re.compile(r'^xref:\s+(.+)\s*$')
-	re_go_part_of = re.compile(r'^relationship:\s+part_of\s+(GO:\d+)\s')
-	# buffer each term lines, then parse lines to create GOTerm node
-	with open(filename) as f:
-		line = f.readline().rstrip()
-		# skip header until first [Term] is reached
-		while not line.startswith('[Term]'): 
-			line = f.readline().rstrip()
-		buff = []  
-		line = f.readline()
-		stop = False
-		while line and not stop:
-			line = line.rstrip()
-			# new Term
-			if line.startswith('[Term]'):
-				parseTerm(buff)
-				buff=[]
-			# last Term
-			elif line.startswith('[Typedef]'):
-				parseTerm(buff)
-				stop=True
-			# or append to buffer
-			else:
-				buff.append(line)
-			line = f.readline()
+
+	# current term state: field values, alt ids and parent links accumulate
+	# here and are only committed once the block ends and is known to be
+	# non-obsolete (no per-term buffer list, single line pass); terms and
+	# edges are staged in batches and shoved into the graph in one pass at
+	# the end of the file to amortize per-call overhead
+	pending = {}
+	alt_ids = []
+	parents = []
+	obsolete = False
+	nodes_batch = []  # (go_id, attributes) pairs
+	edges_batch = []  # (go_id, parent_id, attributes) triples
+
+	def commitTerm():
+		# stage the current term block, then reset the state
+		nonlocal obsolete
+		go_id = pending.pop('id', None)
+		if go_id is not None and not obsolete:
+			go_attr = { 'type': _GOTERM_TYPE }
+			go_attr.update(pending)
+			nodes_batch.append((go_id, go_attr))
+			for alt in alt_ids:
+				go_graph.alt_id[alt] = go_id  # alt_id → go_id
+			for parent_id, relationship in parents:
+				edges_batch.append((go_id, parent_id, { 'relationship': relationship }))
+		pending.clear()
+		del alt_ids[:]
+		del parents[:]
+		obsolete = False
+
+	# handlers for the OBO tags relevant to the graph, keyed by tag name;
+	# lines are parsed as bytes and only the values actually stored on a
+	# node are decoded to str
+	def _on_id(rest):
+		pending['id'] = _parse_go_id(rest)
+	def _on_name(rest):
+		pending['name'] = rest.decode('utf-8')
+	def _on_namespace(rest):
+		namespace = rest.decode('ascii')
+		pending['namespace'] = _NAMESPACES.setdefault(namespace, sys.intern(namespace))
+	def _on_def(rest):
+		m = _RE_GO_DEF_VALUE.match(rest.decode('utf-8'))
+		if m: pending['def'] = m.group(1)
+	def _on_alt_id(rest):
+		alt = _parse_go_id(rest)
+		if alt: alt_ids.append(alt)
+	def _on_is_a(rest):
+		parent_id = _parse_go_id(rest)
+		if parent_id: parents.append((parent_id, 'is a'))
+	def _on_relationship(rest):
+		if rest.startswith(b'part_of '):
+			parent_id = _parse_go_id(rest[8:])
+			if parent_id: parents.append((parent_id, 'part of'))
+	def _on_obsolete(rest):
+		nonlocal obsolete
+		if rest.startswith(b'true'): obsolete = True
+	handlers = { b'id': _on_id, b'name': _on_name, b'namespace': _on_namespace,
+	             b'def': _on_def, b'alt_id': _on_alt_id, b'is_a': _on_is_a,
+	             b'relationship': _on_relationship, b'is_obsolete': _on_obsolete }
+
+	# memory-map the file and walk newline positions over raw bytes: no
+	# UTF-8 decode and no per-line str object for the many lines (synonyms,
+	# xrefs, subsets, ...) that no handler cares about
+	with open(filename, 'rb') as f:
+		mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			size = len(mm)
+			i = 0
+			in_header = True
+			while i < size:
+				j = mm.find(b'\n', i)
+				if j < 0:
+					j = size
+				line = mm[i:j]
+				i = j + 1
+				if line.endswith(b'\r'):
+					line = line[:-1]
+				# skip header until first [Term] is reached
+				if in_header:
+					if line.startswith(b'[Term]'):
+						in_header = False
+					continue
+				# new Term: commit the previous block
+				if line.startswith(b'[Term]'):
+					commitTerm()
+				# last Term
+				elif line.startswith(b'[Typedef]'):
+					break
+				# or dispatch on the fixed ASCII tag before ': ' with one
+				# C-level partition + one dict lookup per line instead of
+				# trying up to six regexes in sequence
+				else:
+					tag, sep, rest = line.partition(b': ')
+					handler = handlers.get(tag)
+					if handler:
+						handler(rest)
+			commitTerm() # last block ([Typedef] reached or end of file)
+		finally:
+			mm.close()
+	go_graph.add_nodes_from(nodes_batch)
+	go_graph.add_edges_from(edges_batch)
+	# path-compress alternate id chains once, so that resolving an alt_id
+	# later (e.g. in load_GOA) costs a single dict lookup instead of one
+	# hop at a time
+	alt = go_graph.alt_id
+	for alt_id, go_id in alt.items():
+		while go_id not in go_graph.nodes and go_id in alt:
+			go_id = alt[go_id]
+		alt[alt_id] = go_id
 	return go_graph
 
-def load_GOA(go:Graph, filename, warnings=True):
+def load_GOA(go:Graph, source, warnings=True):
 	"""
 	parse GOA file and add annotated gene products to previsouly loaded graph go
+	source may be a filename or any open text stream (e.g. an HTTP response
+	wrapped in io.TextIOWrapper), so annotations can be parsed while they
+	are being downloaded instead of re-reading a finished file
 
 	Extract of a file to be parsed:
 	gaf-version: 2.1
@@ -119,36 +233,83 @@ def load_GOA(go:Graph, filename, warnings=True):
 	16 		Annotation Extension 			optional 	0 or greater 	part_of(CL:0000576)
 	17 		Gene Product Form ID 			optional 	0 or 1 			UniProtKB:P12345-2
 	"""
-	with open(filename) as f: 
-		line = f.readline()
-		while line:
-			if not line.startswith('!'): # skip comments
-				cols = line.rstrip().split('\t')
+	# annotations are staged during the line pass and shoved into the graph
+	# in one batch at the end, so the per-node and per-edge bookkeeping of
+	# add_node/add_edge is paid once per gene product / annotation instead
+	# of once per line
+	gp_attrs = {}  # gp_id -> gene product attributes (last line wins)
+	annotations = defaultdict(list)  # (gp_id, gt_id) -> list of evidence codes
+	aliases_cache = {}  # raw aliases field -> shared split list; annotation
+	                    # lines of a gene product repeat the same field, so
+	                    # the split is done once per distinct value
+	if isinstance(source, (str, os.PathLike)):
+		f = open(source, buffering=1<<20, newline='')
+		close_when_done = True
+	else: # already an open text stream
+		f = source
+		close_when_done = False
+	# csv.reader tokenizes the tab-separated columns in C, which is faster
+	# than a Python-level rstrip + split per line; QUOTE_NONE keeps the
+	# field splitting identical to a plain split('\t')
+	try:
+		for cols in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+			# reject comments, blank lines and truncated rows before any
+			# column is touched: a GAF annotation needs at least the 11
+			# columns indexed below, and whitespace-only separator lines
+			# would otherwise raise an IndexError
+			if len(cols) >= 11 and not cols[0].startswith('!'):
 				gp_id = cols[1]
 				gt_id = cols[4]
-				if gt_id not in go.nodes: # GOTerm not found search alternate ids
-					while gt_id not in go.nodes and gt_id in go.alt_id:
-						gt_id = go.alt_id[gt_id] # replace term by alternate
+				if gt_id not in go.nodes: # GOTerm not found: resolve alternate id
+					# alt_id chains are path-compressed by load_OBO, so one
+					# lookup fully resolves the id
+					gt_id = go.alt_id.get(gt_id, gt_id)
 				if gt_id not in go.nodes: # failure: warn user
 					if warnings:
 						print(f'Warning: could not attach a gene product ({gp_id}) to a non existing GO Term ({gt_id})\n')
 				else: # success: GOTerm to attach to was found
-					# create node for gene product if not already present
-					if gp_id not in go.nodes:
-						gp_attr = go.add_node(gp_id, { 'id': gp_id, 'type': 'GeneProduct'})
-					# create or update gene product attributes
-					gp_attr = go.nodes[gp_id]
-					gp_attr['name'] = cols[2]
-					gp_attr['desc'] = cols[9]
-					gp_attr['aliases'] = cols[10].split('|')
-					# attach gene product to GOTerm
-					gt_attr = go.nodes[gt_id]
-					e_attr = go.add_edge(gp_id, gt_id)
-					e_attr['relationship'] = 'annotation'
-					if 'evidence-codes' not in e_attr:
-						e_attr['evidence-codes'] = []
-					e_attr['evidence-codes'].append( cols[6] )
-			line = f.readline()
+					raw = cols[10]
+					aliases = aliases_cache.get(raw)
+					if aliases is None:
+						aliases = raw.split('|')
+						aliases_cache[raw] = aliases
+					# stage gene product attributes
+					gp_attrs[gp_id] = { 'id': gp_id, 'type': _GENE_PRODUCT_TYPE,
+					                    'name': cols[2], 'desc': cols[9],
+					                    'aliases': aliases }
+					# stage the annotation, accumulating interned evidence codes
+					code = cols[6]
+					annotations[(gp_id, gt_id)].append( _EVIDENCE_CODES.setdefault(code, sys.intern(code)) )
+	finally:
+		if close_when_done:
+			f.close()
+	# single bulk shove into the graph; add_nodes_from/add_edges_from are
+	# add-if-absent, so staged entries that already exist — a GOA file
+	# distributed in several chunks, or a reloaded one — are merged by
+	# hand: gene product attributes are refreshed and evidence codes keep
+	# accumulating on the existing annotation edge
+	go_nodes = go.nodes
+	go_edges = go.edges
+	new_gps = []
+	for gp_id, attrs in gp_attrs.items():
+		node = go_nodes.get(gp_id)
+		if node is None:
+			new_gps.append((gp_id, attrs))
+		elif node: # existing gene product: refresh its attributes in place
+			node.update(attrs)
+		else: # attribute-less node (shared empty sentinel): give it its own dict
+			go_nodes[gp_id] = attrs
+	go.add_nodes_from(new_gps)
+	new_annotations = []
+	for (gp_id, gt_id), codes in annotations.items():
+		attrs = go_edges[gp_id].get(gt_id)
+		if attrs is None:
+			new_annotations.append((gp_id, gt_id, { 'relationship': 'annotation', 'evidence-codes': codes }))
+		elif 'evidence-codes' in attrs: # existing annotation: append the new codes
+			attrs['evidence-codes'].extend(codes)
+		else:
+			go_edges[gp_id][gt_id] = { 'relationship': 'annotation', 'evidence-codes': codes }
+	go.add_edges_from(new_annotations)
 
 def GOTerms(go:Graph, gp_id, recursive=False):
 	"""
@@ -166,22 +327,39 @@ def GOTerms(go:Graph, gp_id, recursive=False):
 				  Returns None if the gp_id is not found in the GO graph.
 	"""
 	if not recursive:
-		if gp_id in go.nodes:
-			# Return directly linked GO terms (successors)
-			return go.neighbors(gp_id)
+		# Return directly linked GO terms (successors) as a concrete list
+		# EAFP: the id is almost always present, so one dict hit with a
+		# cold exception path beats two membership tests
+		try:
+			successors = go.edges[gp_id]
+		except KeyError:
+			return None
+		return sorted(successors)
 	else:
 		# GOTerms directly linked (successors) AND their descendants should be returned
-		def get_descendants(go, node, descendants):
-			for neighbor in go.neighbors(node):
-				if go.nodes[neighbor]['type'] == 'GOTerm' and neighbor not in descendants:
-					# Add the neighbor to descendants set
-					descendants.add(neighbor)
-					# Recursively find descendants of the neighbor
-					get_descendants(go, neighbor, descendants)
+		# the GO graph is static between queries, so the closure is
+		# memoized per graph as a frozenset; the cache is cleared by the
+		# graph itself whenever it is mutated
+		cached = go._closure_cache.get(('GOTerms', gp_id))
+		if cached is not None:
+			return list(cached)
+		# iterative BFS with a deque: no Python recursion limit and no
+		# function-call frame per visited node
 		descendants = set()
 		if gp_id in go.nodes:
+			# type checks read one byte from the dense type array instead
+			# of a per-node dict lookup
+			index, codes = _type_index(go)
 			# Start finding descendants from the given gene product ID
-			get_descendants(go, gp_id, descendants)
+			queue = deque([gp_id])
+			while queue:
+				node = queue.popleft()
+				for neighbor in go.neighbors(node):
+					if codes[index[neighbor]] == _GOTERM and neighbor not in descendants:
+						# Add the neighbor to descendants set and explore it later
+						descendants.add(neighbor)
+						queue.append(neighbor)
+		go._closure_cache[('GOTerms', gp_id)] = frozenset(descendants)
 		# Return the list of all descendants
 		return list(descendants)
 	
@@ -205,25 +383,44 @@ def GeneProducts(go:Graph, go_id, recursive=False):
 	- If `recursive` is True, another helper function `get_ancestors` is used to find all ancestors.
 	"""
 	if not recursive:
-		if go_id in go.nodes:
-			# Return direct predecessors of type GeneProduct
-			return [node for node in predecessors(go, go_id) if go.nodes[node]['type'] == 'GeneProduct']
+		# Return direct predecessors of type GeneProduct as a concrete list
+		# EAFP, as in GOTerms: missing ids take the cold exception path
+		try:
+			direct_predecessors = predecessors(go, go_id)
+		except ValueError:
+			return None
+		index, codes = _type_index(go)
+		return [node for node in direct_predecessors if codes[index[node]] == _GENE_PRODUCT]
 	else:
-		def get_ancestors(go, node, ancestors):
-			"""
-			Recursively find all ancestors of type GeneProduct connected by a path.
-			"""
-			for neighbor in predecessors(go, node):
-				if go.nodes[neighbor]['type'] == 'GeneProduct' and neighbor not in ancestors:
-					# Add the neighbor to ancestors set
-					ancestors.add(neighbor)
-				# Recursively find ancestors of the neighbor
-				get_ancestors(go, neighbor, ancestors)
-
+		# memoized per graph like GOTerms(recursive=True); the cache is
+		# cleared by the graph itself whenever it is mutated
+		cached = go._closure_cache.get(('GeneProducts', go_id))
+		if cached is not None:
+			return list(cached)
+		# iterative BFS with a deque: no Python recursion limit and no
+		# function-call frame per visited node; the seen set also stops the
+		# traversal from revisiting shared ancestry, which the previous
+		# recursive version re-explored, and GeneProduct nodes are not
+		# expanded further (they have no predecessors of interest)
 		ancestors = set()
 		if go_id in go.nodes:
+			# type checks read one byte from the dense type array instead
+			# of a per-node dict lookup
+			index, codes = _type_index(go)
 			# Start finding ancestors from the given GO term ID
-			get_ancestors(go, go_id, ancestors)
+			seen = {go_id}
+			queue = deque([go_id])
+			while queue:
+				node = queue.popleft()
+				for neighbor in predecessors(go, node):
+					if neighbor not in seen:
+						seen.add(neighbor)
+						if codes[index[neighbor]] == _GENE_PRODUCT:
+							# Add the neighbor to ancestors set
+							ancestors.add(neighbor)
+						else:
+							queue.append(neighbor)
+		go._closure_cache[('GeneProducts', go_id)] = frozenset(ancestors)
 		# Return the list of all ancestors
 		return list(ancestors)
 
@@ -262,7 +459,11 @@ if __name__ == "__main__":
 		if not os.path.exists(filename_goa):
 			url = "http://ftp.ebi.ac.uk/pub/databases/GO/goa/proteomes/122.R_norvegicus.goa"
 			print(f"File 122.R_norvegicus.goa not found in data/.\nDownloading from {url}...")
-			urllib.request.urlretrieve(url, filename_goa)
+			# stream the response to disk in 1 MiB chunks: constant memory,
+			# no intermediate temporary file
+			with urllib.request.urlopen(url) as response, open(filename_goa, 'wb') as out:
+				for chunk in iter(lambda: response.read(1<<20), b''):
+					out.write(chunk)
 			print("Downloaded 122.R_norvegicus.goa")
 	
  	# Load Graph
@@ -274,6 +475,8 @@ if __name__ == "__main__":
 	# Load Gene Ontology Annotations
 	load_GOA(go, filename_goa)
 	print(f"GO graph: {len(go.nodes)} nodes, {len(go.edges)} edges")
+	# freeze the loaded graph into its read-optimized layout before querying
+	go.seal()
  
 	# Test non-recursive functions
  
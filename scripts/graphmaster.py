@@ -1,11 +1,130 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import csv
+import os
+import types
 from collections import deque
+from multiprocessing import Pool
 import sys
 from pprint import pprint # pprint allows for better display of dictionaries
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError: # numba is optional: pure-Python kernels are used instead
+    njit = None
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse import csgraph as _csgraph
+except ImportError: # scipy is optional: pure-Python BFS is used instead
+    _csgraph = None
+
+try:
+    import pandas as pd
+except ImportError: # pandas is optional: csv.reader parses instead
+    pd = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _csr_reach_kernel(indptr, indices, start):
+        """
+        Compiled CSR reachability: returns the dense indices of every node
+        reachable from start, start excluded.
+        """
+        n = indptr.shape[0] - 1
+        visited = np.zeros(n, np.uint8)
+        stack = np.empty(n, np.int32)
+        order = np.empty(n, np.int32)
+        sp = 0
+        count = 0
+        stack[sp] = start
+        sp += 1
+        visited[start] = 1
+        while sp:
+            sp -= 1
+            v = stack[sp]
+            for k in range(indptr[v], indptr[v + 1]):
+                u = indices[k]
+                if not visited[u]:
+                    visited[u] = 1
+                    order[count] = u
+                    count += 1
+                    stack[sp] = u
+                    sp += 1
+        return order[:count]
+
+    @njit(cache=True)
+    def _bfs_kernel(indptr, indices, start, dist, pred, stamp, gen):
+        """
+        Compiled BFS over CSR arrays, filling the caller's stamped
+        distance/predecessor buffers. The start cell must already be
+        initialized (dist 0, stamp set) by the caller.
+        """
+        n = indptr.shape[0] - 1
+        queue = np.empty(n, np.int32)
+        head = 0
+        tail = 1
+        queue[0] = start
+        while head < tail:
+            u = queue[head]
+            head += 1
+            du = dist[u] + 1
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if stamp[v] != gen:
+                    stamp[v] = gen
+                    dist[v] = du
+                    pred[v] = u
+                    queue[tail] = v
+                    tail += 1
+
+    @njit(cache=True, parallel=True)
+    def _reach_many_kernel(indptr, indices, starts, out_bits):
+        """
+        Compiled batch reachability: one independent BFS per source node,
+        distributed over all cores, each filling a bit-packed uint64 row.
+        """
+        n = indptr.shape[0] - 1
+        one = np.uint64(1)
+        for i in prange(starts.shape[0]):
+            visited = np.zeros(n, np.uint8)
+            stack = np.empty(n, np.int32)
+            sp = 0
+            start = starts[i]
+            stack[sp] = start
+            sp += 1
+            visited[start] = 1
+            while sp:
+                sp -= 1
+                v = stack[sp]
+                for k in range(indptr[v], indptr[v + 1]):
+                    u = indices[k]
+                    if not visited[u]:
+                        visited[u] = 1
+                        out_bits[i, u >> 6] |= one << np.uint64(u & 63)
+                        stack[sp] = u
+                        sp += 1
+
+# shared read-only sentinel for nodes/edges created without attributes:
+# one object instead of one empty dict per entry (GO loads ~500k of them).
+# Upgraded to a private dict the first time a caller asks for the attributes.
+_EMPTY_ATTRS = types.MappingProxyType({})
+
 class Graph:
+    # fixed attribute layout: no per-instance __dict__, slightly faster
+    # attribute access in the traversal loops
+    __slots__ = (
+        'nodes', 'edges', 'directed', 'weighted', 'weight_attribute',
+        'alt_id', 'roots', 'leaves',
+        '_closure_cache', '_reach_index', '_reach_nodes',
+        'anc_bits', 'desc_bits', '_csr',
+        '_src', '_dst', '_w',
+        '_bfs_dist', '_bfs_pred', '_bfs_stamp', '_bfs_gen',
+    )
+
     def __init__(self, directed=True, weighted=False, weight_attribute=None):
         """
         Initializes a graph object.
@@ -21,8 +140,21 @@ class Graph:
         self.weighted = weighted
         self.weight_attribute = weight_attribute
         self.alt_id = {}  # alternative id for nodes
-        self.roots = [] # list of nodes with no predecessors
-        self.leaves = [] # list of nodes with no successors
+        self.roots = set() # nodes with no predecessors
+        self.leaves = set() # nodes with no successors
+        self._closure_cache = {} # memoized traversal results, cleared on mutation
+        self._reach_index = None # node -> bit position, set by precompute_reachability
+        self._reach_nodes = None # bit position -> node
+        self.anc_bits = None # per-node ancestor bitmasks
+        self.desc_bits = None # per-node descendant bitmasks
+        self._csr = None # frozen CSR adjacency, built lazily and dropped on mutation
+        self._src = None # struct-of-arrays edge table: source index per edge (seal)
+        self._dst = None # target index per edge
+        self._w = None # float32 weight per edge, when the graph is weighted
+        self._bfs_dist = None # reusable per-BFS distance buffer (see _bfs_buffers)
+        self._bfs_pred = None # reusable per-BFS predecessor buffer
+        self._bfs_stamp = None # generation stamps marking which cells are current
+        self._bfs_gen = 0 # generation counter, incremented on each bfs call
 
     def display_nodes(self):
         """
@@ -100,6 +232,23 @@ class Graph:
         else:
             print(f"\nNo path found from {start_node_id} to {end_node_id}.")
 
+    def _invalidate_caches(self):
+        """
+        Drops memoized query results. Called whenever the graph is mutated,
+        so cached answers can never go stale.
+        """
+        if self._closure_cache:
+            self._closure_cache.clear()
+        if self._reach_index is not None:
+            self._reach_index = None
+            self._reach_nodes = None
+            self.anc_bits = None
+            self.desc_bits = None
+        self._csr = None
+        self._src = None
+        self._dst = None
+        self._w = None
+
     def add_node(self, node_id, attributes=None):
         """
         Adds a node with the given node_id to the graph. If the node already exists, it does nothing.
@@ -111,15 +260,45 @@ class Graph:
         Returns:
         dict: The attributes of the node with the given node_id.
         """
+        if type(node_id) is str:  # interned labels hit the dict fast path on every later probe
+            node_id = sys.intern(node_id)
         if node_id not in self.nodes:  # ensure node does not already exist
-            if attributes is None:  # create empty attributes if not provided
-                attributes = {}
+            self._invalidate_caches()
+            if attributes is None:  # share the empty sentinel instead of a fresh dict
+                attributes = _EMPTY_ATTRS
             self.nodes[node_id] = attributes
             self.edges[node_id] = {}  # init outgoing edges
             if self.directed:  # if directed graph
-                self.roots.append(node_id)
-                self.leaves.append(node_id)
-        return self.nodes[node_id]  # return node attributes
+                self.roots.add(node_id)
+                self.leaves.add(node_id)
+        attributes = self.nodes[node_id]
+        if attributes is _EMPTY_ATTRS:  # upgrade before handing out a mutable reference
+            attributes = self.nodes[node_id] = {}
+        return attributes  # return node attributes
+
+    @classmethod
+    def from_csr(cls, indptr, indices, node_labels, directed=True):
+        """
+        Builds a graph from frozen CSR arrays, the inverse of to_csr. Handy
+        for cloning a prepared topology (e.g. a test fixture) without
+        replaying individual add_edge calls.
+
+        Parameters:
+        indptr (numpy.ndarray): Successor offsets, one entry per node plus one.
+        indices (numpy.ndarray): Dense successor indices, aligned with indptr.
+        node_labels (sequence): Node identifiers, indexed by dense position.
+        directed (bool): Whether the resulting graph is directed. Default is True.
+
+        Returns:
+        Graph: A new graph with the given adjacency.
+        """
+        graph = cls(directed=directed)
+        graph.add_nodes_from((label, None) for label in node_labels)
+        graph.add_edges_from(
+            (node_labels[u], node_labels[int(indices[k])])
+            for u in range(len(node_labels))
+            for k in range(int(indptr[u]), int(indptr[u + 1])))
+        return graph
 
     def nb_nodes(self):
         """
@@ -144,23 +323,102 @@ class Graph:
         Returns:
         dict: The attributes of the edge between node_id1 and node_id2.
         """
+        if type(node_id1) is str:  # interned labels hit the dict fast path on every later probe
+            node_id1 = sys.intern(node_id1)
+        if type(node_id2) is str:
+            node_id2 = sys.intern(node_id2)
+
         # create nodes if they do not exist
         if node_id1 not in self.nodes: self.add_node(node_id1, node1_attributes) # ensure node1 exists
         if node_id2 not in self.nodes: self.add_node(node_id2, node2_attributes) # ensure node2 exists
         
         # add edge(s) only if they do not exist
         if node_id2 not in self.edges[node_id1]:
-            if attributes is None: # create empty attributes if not provided
-                attributes = {}
+            self._invalidate_caches()
+            if attributes is None: # share the empty sentinel instead of a fresh dict
+                attributes = _EMPTY_ATTRS
             self.edges[node_id1][node_id2] = attributes
             if not self.directed: # if undirected graph
                 self.edges[node_id2][node_id1] = self.edges[node_id1][node_id2] # share the same attributes as n1->n2
             else:
-                if node_id2 in self.roots:
-                    self.roots.remove(node_id2)
-                if node_id1 in self.leaves:
-                    self.leaves.remove(node_id1)
-        return self.edges[node_id1][node_id2] # return edge attributes
+                self.roots.discard(node_id2)
+                self.leaves.discard(node_id1)
+        attributes = self.edges[node_id1][node_id2]
+        if attributes is _EMPTY_ATTRS: # upgrade before handing out a mutable reference
+            attributes = self.edges[node_id1][node_id2] = {}
+            if not self.directed:
+                self.edges[node_id2][node_id1] = attributes # keep both directions shared
+        return attributes # return edge attributes
+
+    def add_nodes_from(self, nodes):
+        """
+        Adds many nodes to the graph in one call. Existing nodes are left
+        untouched, as in add_node. Bulk loaders should prefer this method:
+        the containers are bound once outside the loop, which avoids the
+        per-call attribute lookups of repeated add_node calls.
+
+        Parameters:
+        nodes (iterable): An iterable of (node_id, attributes) pairs; attributes may be None.
+        """
+        self._invalidate_caches()
+        nodes_d = self.nodes
+        edges_d = self.edges
+        directed = self.directed
+        roots_add = self.roots.add
+        leaves_add = self.leaves.add
+        for node_id, attributes in nodes:
+            if node_id not in nodes_d:  # ensure node does not already exist
+                nodes_d[node_id] = attributes if attributes is not None else _EMPTY_ATTRS
+                edges_d[node_id] = {}  # init outgoing edges
+                if directed:  # if directed graph
+                    roots_add(node_id)
+                    leaves_add(node_id)
+
+    def add_edges_from(self, edges):
+        """
+        Adds many edges to the graph in one call. Missing nodes are created
+        without attributes and existing edges are left untouched, as in
+        add_edge. Roots and leaves are updated once at the end of the batch
+        instead of once per edge.
+
+        Parameters:
+        edges (iterable): An iterable of (node_id1, node_id2) pairs or (node_id1, node_id2, attributes) triples.
+        """
+        self._invalidate_caches()
+        nodes_d = self.nodes
+        edges_d = self.edges
+        directed = self.directed
+        has_predecessor = set()  # nodes that gained an incoming edge
+        has_successor = set()  # nodes that gained an outgoing edge
+        new_nodes = []
+        for item in edges:
+            node_id1, node_id2 = item[0], item[1]
+            attributes = item[2] if len(item) > 2 else None
+            # create nodes if they do not exist
+            if node_id1 not in nodes_d:
+                nodes_d[node_id1] = _EMPTY_ATTRS
+                edges_d[node_id1] = {}
+                new_nodes.append(node_id1)
+            if node_id2 not in nodes_d:
+                nodes_d[node_id2] = _EMPTY_ATTRS
+                edges_d[node_id2] = {}
+                new_nodes.append(node_id2)
+            # add edge(s) only if they do not exist
+            if node_id2 not in edges_d[node_id1]:
+                if attributes is None:  # share the empty sentinel instead of a fresh dict
+                    attributes = _EMPTY_ATTRS
+                edges_d[node_id1][node_id2] = attributes
+                if not directed:  # if undirected graph
+                    edges_d[node_id2][node_id1] = attributes  # share the same attributes as n1->n2
+                else:
+                    has_predecessor.add(node_id2)
+                    has_successor.add(node_id1)
+        if directed:
+            # single rebuild of roots/leaves for the whole batch
+            self.roots.update(new_nodes)
+            self.leaves.update(new_nodes)
+            self.roots.difference_update(has_predecessor)
+            self.leaves.difference_update(has_successor)
 
     def nb_edges(self):
         """
@@ -174,64 +432,113 @@ class Graph:
             count += len(self.edges[node])
         return count
 
-    def read_delim(self, filename, column_separator='\t', potential_weight_attribute=None):
+    def read_delim(self, source, column_separator='\t', potential_weight_attribute=None):
         """
-        Parses a text file with columns separated by the specified column_separator and returns a graph.
-        The file should have the following line syntax:
+        Parses delimited text with columns separated by the specified column_separator and returns a graph.
+        The data should have the following line syntax:
         node_id1   node_id2    att1    att2    att3    ...
-        
+
         Parameters:
-        filename (str): The path to the file to be read.
+        source (str or file-like): The path of the file to be read, or an open text stream (e.g. io.StringIO).
         column_separator (str): The character used to separate columns in the file. Default is tab ('\t').
         potential_weight_attribute (str, optional): The attribute name to be used for weights if the graph is weighted. Default is None.
-        
+
         Returns:
         Graph: A graph object created from the file data.
         """
-        with open(filename) as f: 
-            # GET COLUMNS NAMES
-            tmp = f.readline().rstrip() # rstrip removes the trailing space (lstrip removes leading space, and strip removes both)
-            attNames = tmp.split(column_separator) # create a list with the characters
-            
-            # REMOVES FIRST TWO COLUMNS WHICH CORRESPONDS TO THE LABELS OF THE CONNECTED VERTICES
-            attNames.pop(0)  # remove first column name (source node not to be in attribute names)
-            attNames.pop(0)  # remove second column (target node ...)
-            
+        if pd is not None:
+            # pandas' C tokenizer parses the whole file in one shot and
+            # takes paths and streams alike; dtype=str + na_filter=False
+            # keeps every value a raw string, like the csv path below
+            df = pd.read_csv(source, sep=column_separator, dtype=str,
+                             na_filter=False, quoting=csv.QUOTE_NONE)
+            # the first two columns are the labels of the connected
+            # vertices, the rest are the edge attribute names (interned
+            # once so every row's attribute dict shares the key objects)
+            attNames = [sys.intern(name) for name in df.columns[2:]]
+
             # Check if the graph is weighted by looking for a weight attribute
             if potential_weight_attribute and potential_weight_attribute in attNames:
                 self.weighted = True
                 self.weight_attribute = potential_weight_attribute
-            
-            # PROCESS THE REMAINING LINES
-            row = f.readline().rstrip()
-            while row:
-                vals = row.split(column_separator)
-                u = vals.pop(0) # starting vertex
-                v = vals.pop(0) # finishing vertex
-                att = {}
-                for i in range(len(attNames)):
-                    att[attNames[i]] = vals[i]  # create the corresponding attribute list
-                self.add_edge(u, v, att)
-                row = f.readline().rstrip() # NEXT LINE
+
+            self.add_edges_from(
+                (sys.intern(row[0]), sys.intern(row[1]), dict(zip(attNames, row[2:])))
+                for row in df.itertuples(index=False, name=None))
+        else:
+            if isinstance(source, (str, os.PathLike)):
+                f = open(source, newline='')
+                close_when_done = True
+            else:  # already-open stream: read it but leave closing to the caller
+                f = source
+                close_when_done = False
+            try:
+                # csv.reader tokenizes in C; QUOTE_NONE keeps the raw columns
+                reader = csv.reader(f, delimiter=column_separator, quoting=csv.QUOTE_NONE)
+
+                # GET COLUMNS NAMES; the first two columns are the labels of the
+                # connected vertices, the rest are the edge attribute names
+                header = next(reader, None)
+                # intern the attribute names once: every row's attribute dict
+                # then shares the same key objects
+                attNames = [sys.intern(name) for name in header[2:]] if header else []
+
+                # Check if the graph is weighted by looking for a weight attribute
+                if potential_weight_attribute and potential_weight_attribute in attNames:
+                    self.weighted = True
+                    self.weight_attribute = potential_weight_attribute
+
+                # PROCESS THE REMAINING LINES in one bulk insert: add_edges_from
+                # rebuilds roots/leaves once for the whole file instead of once
+                # per edge
+                # interned node ids collapse the many repeats of each label to
+                # one object, so dict probes short-circuit on pointer equality
+                self.add_edges_from(
+                    (sys.intern(row[0]), sys.intern(row[1]), dict(zip(attNames, row[2:])))
+                    for row in reader if row)
+            finally:
+                if close_when_done:
+                    f.close()
+        self.to_csr() # freeze the freshly loaded adjacency for traversals
+        if self.weighted and self.weight_attribute is not None:
+            self.edge_weights() # parse the weight column to float64 once, at load time
         return self
 
-    def neighbors(self, node_id): 
+    def neighbors(self, node_id):
         """
-        Returns the neighbors of a given node.
+        Returns the neighbors of a given node, in insertion order: sorting
+        every call would cost O(k log k) for traversals that do not care
+        about order (see neighbors_sorted for display purposes).
 
         Args:
             node_id (int): The ID of the node for which to find neighbors.
 
         Returns:
-            list: A sorted list of neighbors for the given node ID. If the node ID 
-            is not in the edges, returns an empty list.
+            list: A list of neighbors for the given node ID. If the node ID
+            is not in the edges, returns None.
         """
         if node_id in self.edges:
-            return sorted(list(self.edges[node_id]))
+            return list(self.edges[node_id])
+
+    def neighbors_sorted(self, node_id):
+        """
+        Returns the neighbors of a given node in sorted order, for callers
+        that display or compare the list.
+
+        Args:
+            node_id (int): The ID of the node for which to find neighbors.
+
+        Returns:
+            list: A sorted list of neighbors for the given node ID. If the
+            node ID is not in the edges, returns None.
+        """
+        if node_id in self.edges:
+            return sorted(self.edges[node_id])
 
     def get_successors(self, node_id):
         """
-        Returns the successors of a given node in a directed graph.
+        Returns the successors of a given node in a directed graph, in
+        insertion order.
 
         Args:
             node_id (any): The identifier of the node for which to find successors.
@@ -240,7 +547,7 @@ class Graph:
             list: A list of successors of the given node.
         """
         if self.directed is True and node_id in self.edges:
-            return sorted(list(self.edges[node_id]))
+            return list(self.edges[node_id])
         else:
             raise ValueError("The graph is undirected or the node does not exist.")
     
@@ -255,14 +562,291 @@ class Graph:
             list: A list of predecessors of the given node.
         """
         if self.directed is True and node_id in self.nodes:
-            predecessors = []
-            for node in self.edges:
-                if node_id in self.edges[node]:
-                    predecessors.append(node)
-            return predecessors
+            # read the predecessor slice straight out of the reverse CSR
+            # instead of scanning every node's successor dict
+            _, _, rev_indptr, rev_indices, index, node_list = self.to_csr()
+            i = index[node_id]
+            return [node_list[k] for k in rev_indices[rev_indptr[i]:rev_indptr[i + 1]]]
         else:
             raise ValueError("The graph is undirected or the node does not exist.")
     
+    def to_csr(self):
+        """
+        Freezes the adjacency into Compressed-Sparse-Row arrays so that
+        traversals iterate contiguous int32 arrays instead of chasing dict
+        entries. Built lazily, cached until the graph is mutated.
+
+        Returns:
+        tuple: (indptr, indices, rev_indptr, rev_indices, index, node_list) where
+            - indptr/indices describe the successors of each node,
+            - rev_indptr/rev_indices describe its predecessors,
+            - index maps node ids to dense integer positions,
+            - node_list maps positions back to node ids.
+        """
+        if self._csr is None:
+            index = {node: i for i, node in enumerate(self.nodes)}
+            node_list = list(self.nodes)
+            n = len(index)
+            # forward CSR: outdegree counts, cumulative offsets, then fill
+            # (self.edges iterates in the same order as the index)
+            indptr = np.zeros(n + 1, dtype=np.int32)
+            for u, neighbors in self.edges.items():
+                indptr[index[u] + 1] = len(neighbors)
+            np.cumsum(indptr, out=indptr)
+            indices = np.empty(int(indptr[-1]), dtype=np.int32)
+            k = 0
+            for neighbors in self.edges.values():
+                for v in neighbors:
+                    indices[k] = index[v]
+                    k += 1
+            # reverse CSR, for predecessor traversals
+            rev_indptr = np.zeros(n + 1, dtype=np.int32)
+            rev_indptr[1:] = np.bincount(indices, minlength=n)
+            np.cumsum(rev_indptr, out=rev_indptr)
+            rev_indices = np.empty(len(indices), dtype=np.int32)
+            fill = rev_indptr[:-1].copy()
+            for u in range(n):
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    rev_indices[fill[v]] = u
+                    fill[v] += 1
+            self._csr = (indptr, indices, rev_indptr, rev_indices, index, node_list)
+        return self._csr
+
+    def edge_columns(self):
+        """
+        Column-oriented view of the edge attributes: one list per attribute
+        name, aligned with the CSR edge order, so a column can be scanned
+        or vectorized without walking one dict per edge. Built lazily from
+        the per-edge dicts (which stay authoritative) and cached until the
+        graph is mutated.
+
+        Returns:
+        dict: attribute name -> list of values indexed by edge position in
+            the CSR indices array; edges lacking the attribute hold None.
+        """
+        cols = self._closure_cache.get('edge_columns')
+        if cols is None:
+            _, indices, _, _, _, node_list = self.to_csr()
+            m = len(indices)
+            cols = {}
+            k = 0
+            # same iteration order as the CSR fill, so position k in a
+            # column is the edge indices[k]
+            for u in node_list:
+                for attributes in self.edges[u].values():
+                    for name, value in attributes.items():
+                        col = cols.get(name)
+                        if col is None:
+                            col = cols[name] = [None] * m
+                        col[k] = value
+                    k += 1
+            self._closure_cache['edge_columns'] = cols
+        return cols
+
+    def edge_weights(self):
+        """
+        The weight of every edge as a float64 array aligned with the CSR
+        edge order: the string-to-float conversion happens once here
+        instead of on every relaxation step of a weighted traversal. Edges
+        lacking the weight attribute hold NaN. Cached until the graph is
+        mutated.
+
+        Returns:
+        numpy.ndarray: float64 weights indexed by edge position in the CSR indices array.
+        """
+        if not self.weighted or self.weight_attribute is None:
+            raise ValueError("The graph is not weighted.")
+        weights = self._closure_cache.get('edge_weights')
+        if weights is None:
+            _, indices, _, _, _, _ = self.to_csr()
+            weights = np.full(len(indices), np.nan)
+            column = self.edge_columns().get(self.weight_attribute)
+            if column is not None:
+                for k, value in enumerate(column):
+                    if value is not None:
+                        weights[k] = float(value)
+            self._closure_cache['edge_weights'] = weights
+        return weights
+
+    def edge_attr(self, node_id1, node_id2, name):
+        """
+        Reads a single edge attribute through the columnar view.
+
+        Parameters:
+        node_id1 (hashable): The identifier for the source node.
+        node_id2 (hashable): The identifier for the target node.
+        name (str): The attribute name to look up.
+
+        Returns:
+        The attribute value, or None if the edge does not carry it.
+        """
+        indptr, indices, _, _, index, _ = self.to_csr()
+        try:
+            i, j = index[node_id1], index[node_id2]
+        except KeyError:
+            raise ValueError("The edge does not exist.")
+        for k in range(indptr[i], indptr[i + 1]):
+            if indices[k] == j:
+                col = self.edge_columns().get(name)
+                return col[k] if col is not None else None
+        raise ValueError("The edge does not exist.")
+
+    def _scipy_matrix(self):
+        """
+        Wraps the CSR arrays in a scipy.sparse matrix so traversals can be
+        delegated to scipy.sparse.csgraph. Cached until the graph is
+        mutated; only called when scipy is importable.
+        """
+        mat = self._closure_cache.get('_scipy_matrix')
+        if mat is None:
+            indptr, indices, _, _, _, node_list = self.to_csr()
+            n = len(node_list)
+            data = np.ones(len(indices), dtype=np.int8)
+            mat = csr_matrix((data, indices, indptr), shape=(n, n))
+            self._closure_cache['_scipy_matrix'] = mat
+        return mat
+
+    def seal(self):
+        """
+        Switches the graph from its mutable build layout to the
+        read-optimized query layout in one call: freezes the adjacency into
+        CSR arrays, precomputes the reachability bitmasks (acyclic graphs
+        only) and path-compresses alt_id chains. Meant to be called once
+        after loading; the bulk upfront cost pays for itself as soon as a
+        few traversals run. Mutating the graph afterwards transparently
+        drops the frozen structures, so sealing is always safe.
+
+        Returns:
+        Graph: The graph itself, to allow chaining.
+        """
+        indptr, indices, _, _, _, _ = self.to_csr()
+        # compact struct-of-arrays edge table: 12 bytes per edge for scans
+        # that only need (source, target, weight)
+        n = len(indptr) - 1
+        self._src = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+        self._dst = indices
+        if self.weighted and self.weight_attribute is not None:
+            self._w = self.edge_weights().astype(np.float32)
+        if self.is_acyclic():
+            self.precompute_reachability()
+        # path-compress alternate id chains: each alt_id points straight to
+        # the first id that is a graph node
+        alt = self.alt_id
+        for key, value in alt.items():
+            while value not in self.nodes and value in alt:
+                value = alt[value]
+            alt[key] = value
+        return self
+
+    def reachability_matrix(self, node_ids, reverse=False):
+        """
+        Computes reachability for a batch of source nodes in one call.
+
+        Parameters:
+        node_ids (iterable): The source node identifiers, one per result row.
+        reverse (bool): If True, walk incoming edges (ascendants) instead of outgoing ones. Default is False.
+
+        Returns:
+        numpy.ndarray: A (len(node_ids), ceil(V/64)) uint64 array; bit j of a
+        row is set when the node at dense position j (see to_csr) is
+        reachable from that row's source. Rows can be combined with
+        numpy.bitwise_and/bitwise_or for vectorized set algebra over
+        closures. The independent per-source searches run on all cores
+        when numba is installed.
+        """
+        indptr, indices, rev_indptr, rev_indices, index, node_list = self.to_csr()
+        if reverse:
+            indptr, indices = rev_indptr, rev_indices
+        node_ids = list(node_ids)
+        starts = np.fromiter((index[node_id] for node_id in node_ids),
+                             dtype=np.int32, count=len(node_ids))
+        out_bits = np.zeros((len(node_ids), (len(node_list) + 63) // 64), dtype=np.uint64)
+        if njit is not None:
+            _reach_many_kernel(indptr, indices, starts, out_bits)
+        else:
+            one = np.uint64(1)
+            for i, start in enumerate(starts):
+                for node_id in self._csr_reachable(indptr, indices, int(start), node_list):
+                    j = index[node_id]
+                    out_bits[i, j >> 6] |= one << np.uint64(j & 63)
+        return out_bits
+
+    def precompute_reachability(self):
+        """
+        Precomputes, for every node of a directed acyclic graph, the set of
+        nodes reachable through outgoing edges (descendants) and through
+        incoming edges (ascendants), stored as integer bitmasks.
+        Each node is assigned a bit position; masks are combined with a
+        word-parallel OR while sweeping the topological order once, so the
+        whole build is O(V+E) bitmask operations. Afterwards,
+        get_descendants/get_ascendants answer straight from the masks.
+        The masks are dropped automatically if the graph is mutated.
+        """
+        order = self.topological_sort()  # raises ValueError if the graph is cyclic
+        index = {node: i for i, node in enumerate(self.nodes)}
+        n = len(index)
+        # descendants: accumulate in reverse topological order, so each
+        # successor's mask is complete before it is OR-ed in
+        desc = [0] * n
+        for node in reversed(order):
+            mask = 0
+            for successor in self.edges[node]:
+                j = index[successor]
+                mask |= desc[j] | (1 << j)
+            desc[index[node]] = mask
+        # ascendants: push each node's mask onto its successors in
+        # topological order
+        anc = [0] * n
+        for node in order:
+            i = index[node]
+            mask = anc[i] | (1 << i)
+            for successor in self.edges[node]:
+                anc[index[successor]] |= mask
+        self._reach_index = index
+        self._reach_nodes = list(self.nodes)
+        self.desc_bits = desc
+        self.anc_bits = anc
+
+    def _nodes_of_mask(self, mask):
+        """
+        Decodes a reachability bitmask into the list of node identifiers,
+        iterating only over the set bits.
+        """
+        nodes = self._reach_nodes
+        result = []
+        while mask:
+            lsb = mask & -mask
+            result.append(nodes[lsb.bit_length() - 1])
+            mask ^= lsb
+        return result
+
+    @staticmethod
+    def _csr_reachable(indptr, indices, start, node_list):
+        """
+        Collects every node reachable from start by iterating CSR slices
+        with an explicit stack and a byte-per-node visited array.
+
+        Returns:
+        list: The node identifiers reachable from start (start excluded).
+        """
+        if njit is not None:
+            # LLVM-compiled inner loop when numba is installed
+            return [node_list[i] for i in _csr_reach_kernel(indptr, indices, np.int32(start))]
+        visited = bytearray(len(node_list))
+        visited[start] = 1
+        stack = [start]
+        reachable = []
+        while stack:
+            u = stack.pop()
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if not visited[v]:
+                    visited[v] = 1
+                    reachable.append(node_list[v])
+                    stack.append(v)
+        return reachable
+
     def get_descendants(self, node_id):
         """
         Returns the descendants of a given node in a directed graph.
@@ -274,14 +858,10 @@ class Graph:
             list: A list of descendants of the given node.
         """
         if self.directed is True and node_id in self.edges:
-            descendants = []
-            stack = [node_id]
-            while stack:
-                current_node = stack.pop()
-                for neighbor in self.edges[current_node]:
-                    descendants.append(neighbor)
-                    stack.append(neighbor)
-            return descendants
+            if self._reach_index is not None:  # precomputed bitmasks available
+                return self._nodes_of_mask(self.desc_bits[self._reach_index[node_id]])
+            indptr, indices, _, _, index, node_list = self.to_csr()
+            return self._csr_reachable(indptr, indices, index[node_id], node_list)
         else:
             raise ValueError("The graph is undirected or the node does not exist.")
     
@@ -296,18 +876,81 @@ class Graph:
             list: A list of ascendants of the given node.
         """
         if self.directed is True and node_id in self.nodes:
-            ascendants = []
-            stack = [node_id]
-            while stack:
-                current_node = stack.pop()
-                for node in self.edges:
-                    if current_node in self.edges[node]:
-                        ascendants.append(node)
-                        stack.append(node)
-            return ascendants
+            if self._reach_index is not None:  # precomputed bitmasks available
+                return self._nodes_of_mask(self.anc_bits[self._reach_index[node_id]])
+            _, _, rev_indptr, rev_indices, index, node_list = self.to_csr()
+            return self._csr_reachable(rev_indptr, rev_indices, index[node_id], node_list)
         else:
             raise ValueError("The graph is undirected or the node does not exist.")
 
+    def __getstate__(self):
+        """
+        Pickles only the core containers. The frozen views (CSR, bitmasks,
+        scratch buffers, memoized results) are derived data and are rebuilt
+        lazily after unpickling. The shared empty-attribute sentinel is not
+        picklable, so it travels as None and is restored on the other side.
+        """
+        return {
+            'nodes': {k: None if v is _EMPTY_ATTRS else v
+                      for k, v in self.nodes.items()},
+            'edges': {u: {v: None if a is _EMPTY_ATTRS else a
+                          for v, a in successors.items()}
+                      for u, successors in self.edges.items()},
+            'directed': self.directed,
+            'weighted': self.weighted,
+            'weight_attribute': self.weight_attribute,
+            'alt_id': self.alt_id,
+            'roots': self.roots,
+            'leaves': self.leaves,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state['directed'], state['weighted'], state['weight_attribute'])
+        self.nodes = {k: _EMPTY_ATTRS if v is None else v
+                      for k, v in state['nodes'].items()}
+        self.edges = {u: {v: _EMPTY_ATTRS if a is None else a
+                          for v, a in successors.items()}
+                      for u, successors in state['edges'].items()}
+        self.alt_id = state['alt_id']
+        self.roots = state['roots']
+        self.leaves = state['leaves']
+
+    def multi_source_bfs(self, sources, processes=None):
+        """
+        Runs one BFS per source node. The searches are independent, so with
+        several sources they are dispatched to a process pool and run in
+        parallel; each worker gets the graph once via pickling and rebuilds
+        its frozen views lazily.
+
+        Parameters:
+        sources (iterable): The starting node identifiers, one BFS each.
+        processes (int, optional): Worker count for the pool. Default is the CPU count; pass 1 to force serial execution.
+
+        Returns:
+        list: The bfs (state, distance, predecessor) tuple for each source, in input order.
+        """
+        sources = list(sources)
+        if processes == 1 or len(sources) < 2:
+            return [self.bfs(source) for source in sources]
+        with Pool(processes) as pool:
+            return pool.starmap(self.bfs, [(source,) for source in sources])
+
+    def _bfs_buffers(self, n):
+        """
+        Returns the reusable BFS work arrays (distance, predecessor, stamp)
+        and a fresh generation number. A cell is valid for the current
+        traversal only if its stamp equals the generation, so repeated bfs
+        calls reuse the same allocations without any O(V) clearing between
+        them.
+        """
+        if self._bfs_dist is None or len(self._bfs_dist) != n:
+            self._bfs_dist = np.empty(n, dtype=np.int32)
+            self._bfs_pred = np.empty(n, dtype=np.int32)
+            self._bfs_stamp = np.zeros(n, dtype=np.int64)
+            self._bfs_gen = 0
+        self._bfs_gen += 1
+        return self._bfs_dist, self._bfs_pred, self._bfs_stamp, self._bfs_gen
+
     def bfs(self, start_node_id):
         """
         Performs a Breadth-First Search (BFS) traversal on a graph starting from a given node.
@@ -321,27 +964,79 @@ class Graph:
                 - distance (dict): A dictionary where keys are nodes and values are the distances from the starting node.
                 - predecessor (dict): A dictionary where keys are nodes and values are their predecessors in the BFS traversal.
         """
-        # Initialize states, distances, and predecessors for each node
-        state = {node: 'UNEXPLORED' for node in self.nodes}
-        distance = {node: float('inf') for node in self.nodes}
-        predecessor = {node: None for node in self.nodes}
+        # Repeat queries from the same source (get_shortest_path fan-out)
+        # hit the memoized result; the cache is cleared on mutation
+        cached = self._closure_cache.get(('bfs', start_node_id))
+        if cached is not None:
+            return cached
 
-        # Mark the start node as discovered and initialize its distance to 0
-        state[start_node_id] = 'DISCOVERED'
-        distance[start_node_id] = 0
-        queue = deque([start_node_id])  # Use a queue for breadth-first traversal
+        # Traverse over the frozen CSR arrays: the inner loop reads a
+        # contiguous int32 slice per node instead of probing nested dicts
+        indptr, indices, _, _, index, node_list = self.to_csr()
+        n = len(node_list)
+        dist, pred, stamp, gen = self._bfs_buffers(n)
+        start = index[start_node_id]
+        dist[start] = 0
+        pred[start] = -1
+        stamp[start] = gen
+        if njit is not None:
+            # compiled tight loop: per-edge work drops to a few machine
+            # instructions, no intermediate arrays
+            _bfs_kernel(indptr, indices, start, dist, pred, stamp, gen)
+        elif _csgraph is not None:
+            # scipy runs the whole traversal in C against the CSR arrays;
+            # breadth_first_order visits nodes in BFS order, so distances
+            # follow from each node's predecessor in a single pass
+            order, sp_pred = _csgraph.breadth_first_order(
+                self._scipy_matrix(), start, directed=True, return_predecessors=True)
+            for u in order[1:]:
+                p = sp_pred[u]
+                dist[u] = dist[p] + 1
+                pred[u] = p
+                stamp[u] = gen
+        else:
+            # level-synchronous BFS: expand the whole frontier with bulk
+            # numpy gathers instead of popping one node at a time
+            frontier = np.array([start], dtype=np.int32)
+            level = 0
+            while frontier.size:
+                level += 1
+                starts = indptr[frontier]
+                degrees = indptr[frontier + 1] - starts
+                total = int(degrees.sum())
+                if total == 0:
+                    break
+                # gather every successor of the frontier in one shot
+                cum = np.cumsum(degrees)
+                gather = np.arange(total, dtype=np.int32) \
+                    + np.repeat(starts - np.concatenate(([0], cum[:-1])), degrees)
+                candidates = indices[gather]
+                sources = np.repeat(frontier, degrees)
+                fresh = stamp[candidates] != gen  # drop already-visited nodes
+                candidates = candidates[fresh]
+                sources = sources[fresh]
+                # a node reached from several frontier nodes keeps one predecessor
+                frontier, first = np.unique(candidates, return_index=True)
+                dist[frontier] = level
+                pred[frontier] = sources[first]
+                stamp[frontier] = gen
 
-        while queue:
-            u = queue.popleft()  # Get the first node from the queue
-            for v in self.edges[u]:  # Traverse all neighbors of node u
-                if state[v] == 'UNEXPLORED':  # If the neighbor has not been explored yet
-                    state[v] = 'DISCOVERED'  # Mark the neighbor as discovered
-                    distance[v] = distance[u] + 1  # Update the distance of the neighbor
-                    predecessor[v] = u  # Set the predecessor of the neighbor
-                    queue.append(v)  # Add the neighbor to the queue for future exploration
-            state[u] = 'FINISHED'  # Mark node u as finished
+        # Convert the dense arrays back to the documented dict form
+        state, distance, predecessor = {}, {}, {}
+        unreached = float('inf')
+        for i, node in enumerate(node_list):
+            if stamp[i] != gen:
+                state[node] = 'UNEXPLORED'
+                distance[node] = unreached
+                predecessor[node] = None
+            else:
+                state[node] = 'FINISHED'
+                distance[node] = int(dist[i])
+                predecessor[node] = node_list[pred[i]] if pred[i] >= 0 else None
 
-        return state, distance, predecessor  # Return states, distances, and predecessors
+        result = (state, distance, predecessor)
+        self._closure_cache[('bfs', start_node_id)] = result
+        return result  # Return states, distances, and predecessors
 
     def dfs(self):
         """
@@ -355,78 +1050,78 @@ class Graph:
             - classification (dict): A dictionary where keys are edges (tuples) and values are edge classifications ('TREE EDGE', 'BACK EDGE', 'CROSS EDGE', 'FORWARD EDGE').
             - finished (dict): A dictionary where keys are nodes and values are finishing times.
         """
-        # Initialize dictionaries to store the state, predecessor, discovery time, edge classification, and finish time for each node
-        state, predecessor, discovered, classification, finished = {}, {}, {}, {}, {}
-        
-        # Set all nodes to the initial state of "UNEXPLORED" and no predecessors
-        for vertex in self.nodes:
-            state[vertex] = "UNEXPLORED"
-            predecessor[vertex] = None
-        
+        # Work on dense node indices: the per-node state is one byte in a
+        # bytearray (0 unexplored, 1 discovered, 2 finished) compared as an
+        # integer, instead of a dict of status strings
+        indptr, indices, _, _, index, node_list = self.to_csr()
+        n = len(node_list)
+        state_v = bytearray(n)
+        pred_v = [-1] * n
+        disc = [0] * n
+        fin = [0] * n
+        classification = {}
+
         # Initialize the time counter
         time = 0
-        
-        # Perform DFS for each node that is still "UNEXPLORED"
-        for vertex in self.nodes:
-            if state[vertex] == "UNEXPLORED":
-                state, predecessor, discovered, classification, finished = self.dfs_visit(vertex, time, state, predecessor, discovered, classification, finished)
-        
-        # Return the state, predecessor, discovery time, edge classification, and finish time for each node
-        return state, predecessor, discovered, classification, finished
 
-    def dfs_visit(self, vertex, time, state, predecessor, discovered, classification, finished):
-        """
-        Perform a Depth-First Search (DFS) visit on a graph starting from a given vertex.
-        
-        Args:
-            vertex (any): The current vertex being visited.
-            time (int): The current time step in the DFS.
-            state (dict): A dictionary tracking the state of each vertex (UNEXPLORED, DISCOVERED, FINISHED).
-            predecessor (dict): A dictionary tracking the predecessor of each vertex.
-            discovered (dict): A dictionary tracking the discovery time of each vertex.
-            classification (dict): A dictionary classifying the edges (TREE EDGE, BACK EDGE, CROSS EDGE, FORWARD EDGE).
-            finished (dict): A dictionary tracking the finish time of each vertex.
-            
-        Returns:
-            tuple: Updated state, predecessor, discovered, classification, and finished dictionaries.
-            
-        The function explores the graph using DFS and classifies the edges based on their types:
-        - TREE EDGE: An edge leading to an undiscovered vertex.
-        - BACK EDGE: An edge leading to an already discovered vertex.
-        - CROSS EDGE: An edge leading to a vertex discovered before the current vertex.
-        - FORWARD EDGE: An edge leading to a vertex discovered after the current vertex.
-        """
-        # Mark the current vertex as discovered
-        state[vertex] = "DISCOVERED"
-        time += 1
-        # Record the discovery time of the current vertex
-        discovered[vertex] = time
-        # Traverse all adjacent vertices
-        for v in self.edges[vertex]:
-            if state[v] == "UNEXPLORED":
-                # If the adjacent vertex is unexplored, set its predecessor and classify the edge as a tree edge
-                predecessor[v] = vertex
-                classification[(vertex, v)] = "TREE EDGE"
-                # Recursively visit the adjacent vertex
-                state, predecessor, discovered, classification, finished = self.dfs_visit(v, time, state, predecessor, discovered, classification, finished)
-            else:
-                if state[v] == "DISCOVERED":
-                    # If the adjacent vertex is discovered, classify the edge as a back edge
-                    classification[(vertex, v)] = "BACK EDGE"
-                else:
-                    if discovered[vertex] > discovered[v]:
-                        # If the current vertex was discovered after the adjacent vertex, classify the edge as a cross edge
-                        classification[(vertex, v)] = "CROSS EDGE"
+        # Visit each still-unexplored node with an explicit stack of
+        # (vertex, successor iterator) pairs instead of recursion, so the
+        # traversal depth is bounded by memory rather than the interpreter
+        # recursion limit. Edges are classified the moment a neighbor is
+        # inspected:
+        # - TREE EDGE: an edge leading to an undiscovered vertex.
+        # - BACK EDGE: an edge leading to an already discovered vertex.
+        # - CROSS EDGE: an edge leading to a vertex discovered before the current vertex.
+        # - FORWARD EDGE: an edge leading to a vertex discovered after the current vertex.
+        for s in range(n):
+            if state_v[s]:
+                continue
+            state_v[s] = 1
+            time += 1
+            disc[s] = time
+            stack = [(s, iter(range(indptr[s], indptr[s + 1])))]
+            while stack:
+                u, successors = stack[-1]
+                advanced = False
+                for k in successors:
+                    v = indices[k]
+                    sv = state_v[v]
+                    if sv == 0:
+                        # An unexplored neighbor extends the tree: descend into it
+                        pred_v[v] = u
+                        classification[(node_list[u], node_list[v])] = "TREE EDGE"
+                        state_v[v] = 1
+                        time += 1
+                        disc[v] = time
+                        stack.append((v, iter(range(indptr[v], indptr[v + 1]))))
+                        advanced = True
+                        break
+                    elif sv == 1:
+                        # A neighbor still on the stack closes a cycle
+                        classification[(node_list[u], node_list[v])] = "BACK EDGE"
+                    elif disc[u] > disc[v]:
+                        classification[(node_list[u], node_list[v])] = "CROSS EDGE"
                     else:
-                        # Otherwise, classify the edge as a forward edge
-                        classification[(vertex, v)] = "FORWARD EDGE"
-        # Mark the current vertex as finished
-        state[vertex] = "FINISHED"
-        # Record the finish time of the current vertex
-        finished[vertex] = time + 1
-        
+                        classification[(node_list[u], node_list[v])] = "FORWARD EDGE"
+                if not advanced:
+                    # All successors handled: u is finished, backtrack
+                    state_v[u] = 2
+                    time += 1
+                    fin[u] = time
+                    stack.pop()
+
+        # Expand the dense vectors back to the documented stringy dicts at
+        # the API boundary (every node was visited, so all are FINISHED)
+        state = dict.fromkeys(self.nodes, "FINISHED")
+        predecessor, discovered, finished = {}, {}, {}
+        for i, node in enumerate(node_list):
+            predecessor[node] = node_list[pred_v[i]] if pred_v[i] >= 0 else None
+            discovered[node] = disc[i]
+            finished[node] = fin[i]
+
+        # Return the state, predecessor, discovery time, edge classification, and finish time for each node
         return state, predecessor, discovered, classification, finished
-    
+
     def get_shortest_path(self, start_node_id, end_node_id):
         """
         Finds the shortest path from start_node_id to end_node_id using BFS.
@@ -446,21 +1141,97 @@ class Graph:
         if end_node_id not in self.nodes:
             raise ValueError(f"End node {end_node_id} does not exist in the graph.")
         
-        state, distance, predecessor = self.bfs(start_node_id)
+        # Trivial query: no traversal needed at all
+        if start_node_id == end_node_id:
+            return [start_node_id]
+
+        # A memoized full BFS from this source answers in O(path length)
+        cached = self._closure_cache.get(('bfs', start_node_id))
+        if cached is not None:
+            _, distance, predecessor = cached
+
+            # If the end node is unreachable, return an empty list
+            if distance[end_node_id] == float('inf'):
+                return []
 
-        # If the end node is unreachable, return an empty list
-        if distance[end_node_id] == float('inf'):
+            # Reconstruct the path from end_node_id to start_node_id
+            path = []
+            current_node = end_node_id
+            while current_node is not None:
+                path.append(current_node)
+                current_node = predecessor[current_node]
+
+            # Reverse the path to get it from start_node_id to end_node_id
+            path.reverse()
+            return path
+
+        # Otherwise meet in the middle: two frontiers explore O(2*b^(d/2))
+        # nodes instead of the O(b^d) reachable set of a one-sided BFS
+        _, _, _, _, index, node_list = self.to_csr()
+        path = self._bidi_bfs(index[start_node_id], index[end_node_id])
+        if path is None:  # the end node is unreachable
             return []
+        return [node_list[i] for i in path]
 
-        # Reconstruct the path from end_node_id to start_node_id
+    def _bidi_bfs(self, start, target):
+        """
+        Bidirectional BFS between two dense CSR indices. The forward
+        frontier grows over the successor arrays and the backward frontier
+        over the predecessor arrays; each round expands whichever frontier
+        is smaller, stopping at the first level where the trees touch.
+
+        Returns:
+        list: The dense indices of a shortest start-to-target path, or None
+            if the two nodes are disconnected.
+        """
+        if start == target:
+            return [start]
+        indptr, indices, rev_indptr, rev_indices, _, _ = self.to_csr()
+        dist_f, pred_f, frontier_f = {start: 0}, {start: -1}, [start]
+        dist_b, pred_b, frontier_b = {target: 0}, {target: -1}, [target]
+        best = None  # (path length, meeting index)
+
+        while frontier_f and frontier_b and best is None:
+            # expand the cheaper side; ties go to the forward frontier
+            forward = len(frontier_f) <= len(frontier_b)
+            ptr, idx = (indptr, indices) if forward else (rev_indptr, rev_indices)
+            dist, pred, frontier = (dist_f, pred_f, frontier_f) if forward \
+                else (dist_b, pred_b, frontier_b)
+            other_dist = dist_b if forward else dist_f
+            level = dist[frontier[0]] + 1
+            nxt = []
+            for u in frontier:
+                for k in range(ptr[u], ptr[u + 1]):
+                    v = int(idx[k])
+                    if v not in dist:
+                        dist[v] = level
+                        pred[v] = u
+                        if v in other_dist:
+                            # contact: keep the best meeting point of this level
+                            total = level + other_dist[v]
+                            if best is None or total < best[0]:
+                                best = (total, v)
+                        else:
+                            nxt.append(v)
+            if forward:
+                frontier_f = nxt
+            else:
+                frontier_b = nxt
+
+        if best is None:
+            return None
+        meet = best[1]
+        # splice the two predecessor chains at the meeting node
         path = []
-        current_node = end_node_id
-        while current_node is not None:
-            path.append(current_node)
-            current_node = predecessor[current_node]
-        
-        # Reverse the path to get it from start_node_id to end_node_id
+        u = meet
+        while u != -1:
+            path.append(u)
+            u = pred_f[u]
         path.reverse()
+        u = pred_b[meet]
+        while u != -1:
+            path.append(u)
+            u = pred_b[u]
         return path
 
     def max_depth(self):
@@ -477,83 +1248,77 @@ class Graph:
         """
         if self.is_acyclic() is False:
             raise ValueError("The graph is not acyclic.")
-        else:	
-            # get the depth between each root and each leaf
-            depths = {}
-            for node_start in self.roots:
-                for node_end in self.leaves:
-                    depths[node_start] = 0
-                    path = self.get_shortest_path(node_start, node_end)
-                    if path:
-                        depths[node_start] = max(depths[node_start], len(path)-1)
-            return max(depths.values())
+        else:
+            # longest-path DP over the reverse topological order: a node is
+            # one level deeper than its deepest successor, so one O(V+E)
+            # sweep replaces the BFS per (root, leaf) pair of the previous
+            # implementation
+            order = self.topological_sort()
+            depth = dict.fromkeys(self.nodes, 0)
+            for node in reversed(order):
+                best = 0
+                for successor in self.edges[node]:
+                    candidate = depth[successor] + 1
+                    if candidate > best:
+                        best = candidate
+                depth[node] = best
+            return max(depth.values()) if depth else 0
 
     def is_acyclic(self):
         """
         Determines if the graph is acyclic.
-        This function uses Depth-First Search (DFS) to classify the edges of the graph.
-        If any edge is classified as a "BACK EDGE", the graph contains a cycle and is not acyclic.
+        Kahn's elimination in topological_sort already detects cycles (nodes
+        trapped in one never reach in-degree zero), so this is a thin
+        wrapper around it rather than a separate DFS pass.
 
         Returns:
         bool: True if the graph is acyclic, False otherwise.
         """
-        # Perform DFS on the graph and get the edge classifications
-        res = self.dfs()
-        classification = res[3]
-        acyclic = True
-
-        # Check if any edge is classified as a "BACK EDGE"
-        for key in classification:
-            if classification[key] == "BACK EDGE":
-                acyclic = False  # If a back edge is found, the graph is not acyclic
-
-        return acyclic  # Return True if no back edges are found, otherwise False
+        # memoized per graph state: seal() and max_depth() both ask, and
+        # the answer only changes on mutation (which clears the cache)
+        acyclic = self._closure_cache.get('is_acyclic')
+        if acyclic is None:
+            try:
+                self.topological_sort()
+                acyclic = True
+            except ValueError:
+                acyclic = False
+            self._closure_cache['is_acyclic'] = acyclic
+        return acyclic
 
     def topological_sort(self):
         """
-        Performs a topological sort on a Directed Acyclic Graph (DAG).
+        Performs a topological sort on a Directed Acyclic Graph (DAG) using
+        Kahn's algorithm: nodes are emitted as soon as all their
+        predecessors have been emitted. Ordering and cycle detection come
+        out of the same O(V+E) pass — a cycle leaves nodes with positive
+        in-degree that are never emitted.
 
         Returns:
             list: A list of nodes sorted in topological order.
         """
-        def dfs_topological(v, visited, stack):
-            """
-            Perform a Depth-First Search (DFS) to achieve topological sorting of a graph.
-
-            Args:
-                v (int): The current node to process.
-                visited (list of bool): A list indicating whether each node has been visited.
-                stack (list of int): The stack to store the topologically sorted nodes.
-
-            Returns:
-                None: This function modifies the visited list and stack in place.
-
-            The function marks the current node as visited, recursively visits all its unvisited neighbors,
-            and finally adds the current node to the stack once all its neighbors have been visited.
-            """
-            # Mark the current node as visited
-            visited[v] = True
-            # Traverse all neighbors of the current node
-            for neighbor in self.edges[v]:
-                # If the neighbor has not been visited yet, recursively call dfs_topological
-                if not visited[neighbor]:
-                    dfs_topological(neighbor, visited, stack)
-            # Add the current node to the stack once all its neighbors have been visited
-            stack.append(v)
-
-        # Initialize all nodes as not visited
-        if not self.is_acyclic():
-            raise ValueError("The graph is not acyclic")
-        visited = {node: False for node in self.nodes}
-        stack = []
-        
-        # Perform DFS for each unvisited node
-        for node in self.nodes:
-            if not visited[node]:
-                dfs_topological(node, visited, stack)
+        # Count the predecessors of every node in one C pass: the CSR
+        # indices array lists each edge's target exactly once
+        indptr, indices, _, _, _, node_list = self.to_csr()
+        n = len(node_list)
+        indegree = np.bincount(indices, minlength=n)
 
-        # Return the reversed stack to get the topological order
-        return stack[::-1]
+        # Seed the queue with the nodes that have no predecessors
+        queue = deque(np.where(indegree == 0)[0].tolist())
+        order = []
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                indegree[v] -= 1
+                if indegree[v] == 0:  # last predecessor emitted: v is ready
+                    queue.append(v)
+
+        # Nodes caught in a cycle never reach in-degree zero
+        if len(order) != n:
+            raise ValueError("The graph is not acyclic")
+        return [node_list[i] for i in order]
 
 ##### main → tests #####
 if __name__ == "__main__":
@@ -2,12 +2,33 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+import io
+import pickle
+import numpy as np
 from graphmaster import Graph
-import tempfile
-import os
 
 class TestGraph(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # the A->B, A->C, B->D diamond shared by the traversal tests is
+        # built once from its frozen CSR snapshot, then stored as a pickle
+        # blob; each test rehydrates a private copy from the blob instead
+        # of replaying add_edge calls
+        indptr, indices, labels = cls._build_csr_fixture()
+        seed = Graph.from_csr(indptr, indices, labels)
+        cls._seed_blob = pickle.dumps(seed, protocol=5)
+
+    @classmethod
+    def _build_csr_fixture(cls):
+        labels = ['A', 'B', 'C', 'D']
+        indptr = np.array([0, 2, 3, 3, 3], dtype=np.int32)
+        indices = np.array([1, 2, 3], dtype=np.int32)
+        return indptr, indices, labels
+
+    def _diamond_graph(self):
+        return pickle.loads(self._seed_blob)
+
     def setUp(self):
         self.graph = Graph(directed=True, weighted=False)
 
@@ -33,23 +54,19 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(self.graph.nb_nodes(), 3)
 
     def test_nb_edges(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('B', 'C')
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C')])
         self.assertEqual(self.graph.nb_edges(), 2)
         self.graph.add_edge('C', 'D')
         self.assertEqual(self.graph.nb_edges(), 3)
 
     def test_neighbors(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('A', 'C')
-        self.assertEqual(set(self.graph.neighbors('A')), {'B', 'C'})
+        self.graph.add_edges_from([('A', 'B'), ('A', 'C')])
+        self.assertCountEqual(self.graph.neighbors('A'), ['B', 'C'])
         self.graph.add_edge('A', 'D')
-        self.assertEqual(set(self.graph.neighbors('A')), {'B', 'C', 'D'})
+        self.assertCountEqual(self.graph.neighbors('A'), ['B', 'C', 'D'])
 
     def test_bfs(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('A', 'C')
-        self.graph.add_edge('B', 'D')
+        self.graph = self._diamond_graph()
         state, distance, predecessor = self.graph.bfs('A')
         self.assertEqual(state['D'], 'FINISHED')
         self.assertEqual(distance['D'], 2)
@@ -60,9 +77,7 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(predecessor['E'], 'C')
 
     def test_shortest_path(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('B', 'C')
-        self.graph.add_edge('A', 'C')
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C'), ('A', 'C')])
         path = self.graph.get_shortest_path('A', 'C')
         self.assertEqual(path, ['A', 'C'])
         self.graph.add_edge('C', 'D')
@@ -72,8 +87,7 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(path, ['B', 'C', 'D'])
 
     def test_shortest_path_disconnected_graph(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('C', 'D')
+        self.graph.add_edges_from([('A', 'B'), ('C', 'D')])
         path = self.graph.get_shortest_path('A', 'D')
         self.assertEqual(path, [])
         path = self.graph.get_shortest_path('C', 'D')
@@ -85,8 +99,7 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(path, ['A'])
 
     def test_shortest_path_no_path(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('B', 'C')
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C')])
         with self.assertRaises(ValueError):
             self.graph.get_shortest_path('A', 'D')
         with self.assertRaises(ValueError):
@@ -95,9 +108,7 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(self.graph.get_shortest_path('A', 'D'), [])
 
     def test_dfs(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('A', 'C')
-        self.graph.add_edge('B', 'D')
+        self.graph = self._diamond_graph()
         state, predecessor, discovered, classification, finished = self.graph.dfs()
         self.assertEqual(state['D'], 'FINISHED')
         self.assertEqual(predecessor['D'], 'B')
@@ -109,23 +120,39 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(predecessor['E'], 'C')
 
     def test_is_acyclic(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('B', 'C')
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C')])
         self.assertTrue(self.graph.is_acyclic())
         self.graph.add_edge('C', 'A')
         self.assertFalse(self.graph.is_acyclic())
 
     def test_max_depth(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('A', 'C')
-        self.graph.add_edge('B', 'D')
+        self.graph = self._diamond_graph()
         value = self.graph.max_depth()
         self.assertEqual(value, 2)
 
+    def test_precompute_reachability(self):
+        self.graph = self._diamond_graph()
+        self.graph.precompute_reachability()
+        self.assertEqual(set(self.graph.get_descendants('A')), {'B', 'C', 'D'})
+        self.assertEqual(set(self.graph.get_ascendants('D')), {'A', 'B'})
+        # mutation drops the precomputed masks and answers stay correct
+        self.graph.add_edge('C', 'E')
+        self.assertIn('E', set(self.graph.get_descendants('A')))
+
+    def test_reachability_matrix(self):
+        self.graph = self._diamond_graph()
+        bits = self.graph.reachability_matrix(['A', 'B'])
+        _, _, _, _, index, _ = self.graph.to_csr()
+        def reached(row, node):
+            j = index[node]
+            return bool(bits[row, j >> 6] >> (j & 63) & 1)
+        self.assertTrue(reached(0, 'B'))
+        self.assertTrue(reached(0, 'D'))
+        self.assertFalse(reached(1, 'C'))
+        self.assertTrue(reached(1, 'D'))
+
     def test_topological_sort(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('B', 'C')
-        self.graph.add_edge('A', 'C')
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C'), ('A', 'C')])
         topo_sort = self.graph.topological_sort()
         self.assertEqual(topo_sort, ['A', 'B', 'C'])
         self.graph.add_edge('C', 'D')
@@ -138,43 +165,44 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(topo_sort, ['A'])
 
     def test_topological_sort_disconnected_graph(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('C', 'D')
+        self.graph.add_edges_from([('A', 'B'), ('C', 'D')])
         topo_sort = self.graph.topological_sort()
         self.assertTrue(topo_sort.index('A') < topo_sort.index('B'))
         self.assertTrue(topo_sort.index('C') < topo_sort.index('D'))
 
     def test_topological_sort_cyclic_graph(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('B', 'C')
-        self.graph.add_edge('C', 'A')
+        self.graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'A')])
         with self.assertRaises(ValueError):
             self.graph.topological_sort()
 
     def test_topological_sort_with_multiple_edges(self):
-        self.graph.add_edge('A', 'B')
-        self.graph.add_edge('A', 'C')
-        self.graph.add_edge('B', 'D')
-        self.graph.add_edge('C', 'D')
+        self.graph.add_edges_from([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
         topo_sort = self.graph.topological_sort()
         self.assertTrue(topo_sort.index('A') < topo_sort.index('B'))
         self.assertTrue(topo_sort.index('A') < topo_sort.index('C'))
         self.assertTrue(topo_sort.index('B') < topo_sort.index('D'))
         self.assertTrue(topo_sort.index('C') < topo_sort.index('D'))
 
+    def test_multi_source_bfs(self):
+        self.graph = self._diamond_graph()
+        expected = [self.graph.bfs('A'), self.graph.bfs('B')]
+        # serial and pooled paths must agree with single-source bfs
+        self.assertEqual(self.graph.multi_source_bfs(['A', 'B'], processes=1), expected)
+        self.assertEqual(self.graph.multi_source_bfs(['A', 'B'], processes=2), expected)
+
     def test_read_delim(self):
-        # Create a temporary file with graph data
-        with tempfile.NamedTemporaryFile(delete=False, mode='w', newline='') as temp_file:
-            temp_file.write("node_id1\tnode_id2\tweight\n")
-            temp_file.write("A\tB\t1\n")
-            temp_file.write("B\tC\t2\n")
-            temp_file.write("C\tD\t3\n")
-            temp_file.write("D\tA\t4\n")
-            temp_file_name = temp_file.name
-
-        # Read the graph from the temporary file
+        # Graph data in an in-memory buffer: read_delim accepts a path or
+        # any open text stream, so no temp file is needed
+        buffer = io.StringIO(
+            "node_id1\tnode_id2\tweight\n"
+            "A\tB\t1\n"
+            "B\tC\t2\n"
+            "C\tD\t3\n"
+            "D\tA\t4\n")
+
+        # Read the graph from the buffer
         graph = Graph(directed=True)
-        graph.read_delim(temp_file_name, column_separator='\t', potential_weight_attribute='weight')
+        graph.read_delim(buffer, column_separator='\t', potential_weight_attribute='weight')
 
         # Check nodes
         self.assertIn('A', graph.nodes)
@@ -192,8 +220,16 @@ class TestGraph(unittest.TestCase):
         self.assertIn('A', graph.edges['D'])
         self.assertEqual(graph.edges['D']['A']['weight'], '4')
 
-        # Clean up the temporary file
-        os.remove(temp_file_name)
-
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    # the tests share no state, so run them across all cores when
+    # pytest-xdist is installed; plain unittest remains the fallback
+    try:
+        import pytest
+    except ImportError:
+        unittest.main()
+    else:
+        import importlib.util
+        args = [__file__]
+        if importlib.util.find_spec('xdist') is not None:
+            args += ['-n', 'auto']  # pytest alone chokes on xdist's flag
+        pytest.main(args)
\ No newline at end of file